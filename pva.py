@@ -7,20 +7,31 @@ with columns: scet, name, value, unit
 """
 
 import argparse
+import bisect
 import csv
+import functools
+import heapq
+import operator
+import shutil
 import sys
 import os
-import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from flask import Flask
-import webbrowser
-import threading
-import time
-from io import StringIO
+from itertools import chain, islice, repeat
 import warnings
 warnings.filterwarnings('ignore')
 
+# Buffer size for CSV file I/O (1 MiB) to keep syscall counts low on large logs
+IO_BUFFER_SIZE = 1 << 20
+
+# Number of output rows joined into CSV text per write
+WRITE_CHUNK_ROWS = 1 << 16
+
+# Two-digit HH/MM/SS field -> seconds lookup tables for parse_time_offset_seconds
+HOUR_SECONDS = {'%02d' % i: i * 3600 for i in range(100)}
+MINUTE_SECONDS = {'%02d' % i: i * 60 for i in range(100)}
+SECOND_VALUES = {'%02d' % i: i for i in range(100)}
+
 
 def open_csv_file(file_path):
     """
@@ -29,21 +40,37 @@ def open_csv_file(file_path):
     This is necessary because Docker volume mounts on some systems can introduce
     NUL bytes when reading files, which causes csv.reader to fail.
 
+    The file is streamed line by line rather than read whole, so memory use does
+    not grow with file size. Line endings are handled in universal-newline mode,
+    so '\r', '\r\n' and '\n' are all accepted.
+
     Args:
         file_path: Path to the CSV file
 
     Returns:
         csv.reader object
     """
-    # Read the file and filter out NUL bytes
-    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-        content = f.read()
+    f = open(file_path, 'r', encoding='utf-8', errors='ignore', buffering=IO_BUFFER_SIZE)
+    return csv.reader(strip_nul_bytes(f))
+
+
+def strip_nul_bytes(f):
+    """
+    Yield the lines of an open text file with NUL bytes removed, closing it at the end.
 
-    # Remove NUL bytes
-    content = content.replace('\x00', '')
+    NUL bytes are rare, so clean lines pass through without being copied.
 
-    # Create a StringIO object and return a csv.reader
-    return csv.reader(StringIO(content))
+    Args:
+        f: Open text file object
+
+    Yields:
+        Lines of the file, without NUL bytes
+    """
+    with f:
+        for line in f:
+            if '\x00' in line:
+                line = line.replace('\x00', '')
+            yield line
 
 
 def extract_unit_from_column_name(column_name):
@@ -55,13 +82,100 @@ def extract_unit_from_column_name(column_name):
         AvgAmps(I) -> ('AvgAmps', 'I')
         PSats -> ('PSats', '')
     """
-    if '(' in column_name and column_name.endswith(')'):
-        name_part = column_name[:column_name.index('(')]
-        unit_part = column_name[column_name.index('(') + 1:-1]
+    paren_idx = column_name.find('(')
+    if paren_idx != -1 and column_name.endswith(')'):
+        name_part = column_name[:paren_idx]
+        unit_part = column_name[paren_idx + 1:-1]
         return name_part, unit_part
     return column_name, ''
 
 
+def make_row_getter(indices):
+    """
+    Build a callable that returns the values at the given indices of a row as a tuple.
+
+    operator.itemgetter performs the lookups in C, but returns a bare value for a
+    single index, so the zero- and one-column cases are wrapped to always return a tuple.
+
+    Args:
+        indices: List of column indices
+
+    Returns:
+        Callable taking a row and returning a tuple of values
+    """
+    if not indices:
+        return lambda row: ()
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: (row[index],)
+    return operator.itemgetter(*indices)
+
+
+@functools.lru_cache(maxsize=8192)
+def parse_scet(timestamp):
+    """
+    Parse a SCET timestamp in ISO 8601 ordinal format into a datetime (cached).
+
+    Well-formed timestamps are sliced into integer fields directly, bypassing the
+    strptime format parser. Anything else falls back to strptime, so invalid
+    input raises the same ValueError as before. Long-format rows repeat each
+    timestamp once per data column, so most calls are cache hits.
+
+    Args:
+        timestamp: Timestamp string (e.g., "2025-354T00:00:01")
+
+    Returns:
+        datetime object
+    """
+    if (len(timestamp) == 17 and timestamp[4] == '-' and timestamp[8] == 'T'
+            and timestamp[11] == ':' and timestamp[14] == ':'):
+        digits = timestamp[0:4] + timestamp[5:8] + timestamp[9:11] + timestamp[12:14] + timestamp[15:17]
+        if digits.isascii() and digits.isdigit():
+            year = int(digits[0:4])
+            day_of_year = int(digits[4:7])
+            hour = int(digits[7:9])
+            minute = int(digits[9:11])
+            second = int(digits[11:13])
+            # Year 9999 is left to strptime: day 366 would overflow datetime here
+            if 0 < year < 9999 and 1 <= day_of_year <= 366 and hour < 24 and minute < 60 and second < 60:
+                return datetime(year, 1, 1, hour, minute, second) + timedelta(days=day_of_year - 1)
+    return datetime.strptime(timestamp, '%Y-%jT%H:%M:%S')
+
+
+def format_scet(dt):
+    """
+    Format a datetime as a SCET timestamp in ISO 8601 ordinal format.
+
+    Equivalent to dt.strftime('%Y-%jT%H:%M:%S'), assembled directly instead of
+    going through the platform strftime.
+
+    Args:
+        dt: datetime object
+
+    Returns:
+        Timestamp string (e.g., "2025-354T00:00:01")
+    """
+    day_of_year = dt.toordinal() - datetime(dt.year, 1, 1).toordinal() + 1
+    return '%d-%03dT%02d:%02d:%02d' % (dt.year, day_of_year, dt.hour, dt.minute, dt.second)
+
+
+@functools.lru_cache(maxsize=None)
+def parse_base_date(base_date_str):
+    """
+    Parse a base date string in ISO 8601 ordinal format (cached).
+
+    The base date is constant for every row of a file, so the strptime call is
+    only paid once per distinct value.
+
+    Args:
+        base_date_str: Base date in ISO 8601 ordinal format (e.g., "2025-354T00:00:00")
+
+    Returns:
+        datetime object
+    """
+    return datetime.strptime(base_date_str, '%Y-%jT%H:%M:%S')
+
+
 def parse_time_offset_to_scet(time_str, base_date_str='2025-354T00:00:00'):
     """
     Convert a time offset string to a full SCET timestamp.
@@ -73,10 +187,38 @@ def parse_time_offset_to_scet(time_str, base_date_str='2025-354T00:00:00'):
     Returns:
         Full timestamp string in ISO 8601 format (e.g., "2025-354T00:00:01")
     """
-    # Parse base date (ordinal format: YYYY-DDDTHH:MM:SS)
-    base_date = datetime.strptime(base_date_str, '%Y-%jT%H:%M:%S')
+    result_datetime = parse_base_date(base_date_str) + timedelta(seconds=parse_time_offset_seconds(time_str))
+
+    # Format as ISO 8601 with ordinal date
+    # Format: YYYY-DDDTHH:MM:SS
+    return format_scet(result_datetime)
+
+
+def parse_time_offset_seconds(time_str):
+    """
+    Convert a time offset string to a whole number of seconds.
+
+    Fractional seconds are truncated toward the earlier second, matching the
+    one-second resolution of SCET timestamps. The fraction must still be an
+    integer, so a malformed offset raises ValueError.
+
+    Args:
+        time_str: Time string in format HH:MM:SS.f (e.g., "00:00:01.0")
+
+    Returns:
+        Offset in seconds (int)
+    """
+    # Fast path for the fixed-width HH:MM:SS[.f] layout written by the logger:
+    # each two-digit field is a table lookup instead of an int() parse, and an
+    # all-digit fraction never changes the whole second, so it is only checked
+    if (len(time_str) >= 8 and time_str[2] == ':' and time_str[5] == ':'
+            and (len(time_str) == 8 or (time_str[8] == '.' and time_str[9:].isdecimal()))):
+        hours = HOUR_SECONDS.get(time_str[0:2])
+        minutes = MINUTE_SECONDS.get(time_str[3:5])
+        seconds = SECOND_VALUES.get(time_str[6:8])
+        if hours is not None and minutes is not None and seconds is not None:
+            return hours + minutes + seconds
 
-    # Parse time offset (format: HH:MM:SS.f)
     time_parts = time_str.split(':')
     hours = int(time_parts[0])
     minutes = int(time_parts[1])
@@ -84,19 +226,27 @@ def parse_time_offset_to_scet(time_str, base_date_str='2025-354T00:00:00'):
     # Handle seconds with fractional part
     seconds_parts = time_parts[2].split('.')
     seconds = int(seconds_parts[0])
-    microseconds = 0
     if len(seconds_parts) > 1:
-        # Convert fractional seconds to microseconds
-        frac = seconds_parts[1].ljust(6, '0')[:6]  # Pad or truncate to 6 digits
-        microseconds = int(frac)
+        # Pad or truncate to microseconds; a negative fraction (e.g. "01.-5")
+        # moves the offset back into the previous second
+        if int(seconds_parts[1].ljust(6, '0')[:6]) < 0:
+            seconds -= 1
+    return hours * 3600 + minutes * 60 + seconds
 
-    # Create timedelta and add to base date
-    offset = timedelta(hours=hours, minutes=minutes, seconds=seconds, microseconds=microseconds)
-    result_datetime = base_date + offset
 
-    # Format as ISO 8601 with ordinal date
-    # Format: YYYY-DDDTHH:MM:SS
-    return result_datetime.strftime('%Y-%jT%H:%M:%S')
+@functools.lru_cache(maxsize=None)
+def scet_day_prefix(base_date_str, day_offset):
+    """
+    Get the date part of a SCET timestamp a number of days after the base date (cached).
+
+    Args:
+        base_date_str: Base date in ISO 8601 ordinal format (e.g., "2025-354T00:00:00")
+        day_offset: Number of days after the base date
+
+    Returns:
+        Date prefix string (e.g., "2025-354T")
+    """
+    return (parse_base_date(base_date_str) + timedelta(days=day_offset)).strftime('%Y-%jT')
 
 
 def parse_margin(margin_str):
@@ -143,7 +293,7 @@ def identify_fault_clusters(fault_data, cluster_threshold_minutes=10):
     Faults within the threshold time of each other are grouped into the same cluster.
 
     Args:
-        fault_data: List of fault data tuples (scet, name, value, unit)
+        fault_data: Iterable of fault data tuples (scet, name, value, unit)
         cluster_threshold_minutes: Maximum time gap (in minutes) between faults in the same cluster
 
     Returns:
@@ -155,18 +305,16 @@ def identify_fault_clusters(fault_data, cluster_threshold_minutes=10):
     if not fault_data:
         return []
 
-    # Extract unique fault timestamps (sorted)
-    fault_timestamps = []
+    # Extract unique fault timestamps (sorted); a set keeps deduplication linear
+    unique_timestamps = set()
     for row in fault_data:
         scet = row[0]  # First element is the timestamp
         try:
-            dt = datetime.strptime(scet, '%Y-%jT%H:%M:%S')
-            if dt not in fault_timestamps:
-                fault_timestamps.append(dt)
+            unique_timestamps.add(parse_scet(scet))
         except ValueError:
             continue
 
-    fault_timestamps.sort()
+    fault_timestamps = sorted(unique_timestamps)
 
     if not fault_timestamps:
         return []
@@ -207,7 +355,7 @@ def identify_fault_clusters(fault_data, cluster_threshold_minutes=10):
     return clusters
 
 
-def filter_data_by_clusters(all_rows, fault_clusters, margin_delta=None):
+def filter_data_by_clusters(all_rows, fault_clusters, margin_delta=None, row_range=None):
     """
     Filter data rows to only include those within fault cluster time ranges (with optional margin).
 
@@ -215,6 +363,8 @@ def filter_data_by_clusters(all_rows, fault_clusters, margin_delta=None):
         all_rows: List of data rows (tuples of scet, name, value, unit)
         fault_clusters: List of fault cluster dictionaries with 'min_time' and 'max_time'
         margin_delta: Optional timedelta to extend cluster ranges
+        row_range: Optional (min, max) datetimes known to bound every row's timestamp.
+            If a single cluster range covers it, all rows are kept without checking each.
 
     Returns:
         Filtered list of rows
@@ -234,29 +384,121 @@ def filter_data_by_clusters(all_rows, fault_clusters, margin_delta=None):
 
         cluster_ranges.append((min_time, max_time))
 
-    # Filter rows
+    # Merge overlapping ranges into a sorted, disjoint list so each row needs a
+    # single binary search instead of a scan over every cluster
+    range_starts = []
+    range_ends = []
+    for min_time, max_time in sorted(cluster_ranges):
+        if range_ends and min_time <= range_ends[-1]:
+            range_ends[-1] = max(range_ends[-1], max_time)
+        else:
+            range_starts.append(min_time)
+            range_ends.append(max_time)
+
+    # Nothing can be excluded when the clusters jointly span the whole row range
+    if (row_range and len(range_starts) == 1
+            and range_starts[0] <= row_range[0] and row_range[1] <= range_ends[0]):
+        return all_rows
+
+    # Filter rows. Long-format rows arrive in runs sharing one timestamp (one row
+    # per data column), so the range check is only redone when the timestamp changes.
     filtered_rows = []
+    add_row = filtered_rows.append
+    last_scet = None
+    keep = True
     for row in all_rows:
         scet = row[0]
-        try:
-            row_time = datetime.strptime(scet, '%Y-%jT%H:%M:%S')
+        if scet != last_scet:
+            last_scet = scet
+            try:
+                row_time = parse_scet(scet)
 
-            # Check if row time is within any cluster range
-            in_range = False
-            for min_time, max_time in cluster_ranges:
-                if min_time <= row_time <= max_time:
-                    in_range = True
-                    break
+                # Check if row time is within any cluster range
+                i = bisect.bisect_right(range_starts, row_time) - 1
+                keep = i >= 0 and row_time <= range_ends[i]
+            except ValueError:
+                # Keep rows with invalid timestamps
+                keep = True
 
-            if in_range:
-                filtered_rows.append(row)
-        except ValueError:
-            # Keep rows with invalid timestamps
-            filtered_rows.append(row)
+        if keep:
+            add_row(row)
 
     return filtered_rows
 
 
+@functools.lru_cache(maxsize=None)
+def parse_fault_date(date_part):
+    """
+    Parse the date column of a fault log row (cached).
+
+    Fault logs repeat the same date on many consecutive rows, so each distinct
+    date string only goes through strptime once.
+
+    Supported formats:
+        2025-354   (ordinal)
+        12/20/2025, 20/12/2025, 2025/12/20   (calendar, tried in that order)
+        2025-12-20 (ISO)
+
+    Args:
+        date_part: Date string from the fault log
+
+    Returns:
+        datetime object at midnight of that date
+
+    Raises:
+        ValueError: If the date is not in a supported format
+    """
+    if '-' in date_part and len(date_part.split('-')) == 2:
+        # Ordinal date format: "2025-354"
+        return datetime.strptime(date_part, '%Y-%j')
+    elif '/' in date_part:
+        # Calendar date format: "12/20/2025" or "2025/12/20"
+        # Try MM/DD/YYYY format first
+        try:
+            return datetime.strptime(date_part, '%m/%d/%Y')
+        except ValueError:
+            # Try DD/MM/YYYY format
+            try:
+                return datetime.strptime(date_part, '%d/%m/%Y')
+            except ValueError:
+                # Try YYYY/MM/DD format
+                return datetime.strptime(date_part, '%Y/%m/%d')
+    else:
+        # Try ISO format YYYY-MM-DD
+        return datetime.strptime(date_part, '%Y-%m-%d')
+
+
+def parse_fault_timestamp(date_part, time_part):
+    """
+    Combine the date and time columns of a fault log row into a datetime.
+
+    Ordinal dates require a full HH:MM:SS time; other date formats accept
+    HH:MM with optional seconds (fractional seconds are dropped).
+
+    Args:
+        date_part: Date string (see parse_fault_date for supported formats)
+        time_part: Time string
+
+    Returns:
+        datetime object
+
+    Raises:
+        ValueError, IndexError: If the date or time cannot be parsed
+    """
+    dt = parse_fault_date(date_part)
+    time_parts = time_part.split(':')
+
+    if '-' in date_part and len(date_part.split('-')) == 2:
+        hour, minute, second = time_parts
+        return dt.replace(hour=int(hour), minute=int(minute), second=int(second))
+
+    return dt.replace(
+        hour=int(time_parts[0]),
+        minute=int(time_parts[1]),
+        second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
+    )
+
+
 def parse_fault_data(fault_file, min_time=None, max_time=None):
     """
     Parse fault data from a CSV file.
@@ -267,18 +509,18 @@ def parse_fault_data(fault_file, min_time=None, max_time=None):
         max_time: Optional maximum SCET timestamp for filtering
 
     Returns:
-        List of tuples: [(scet, name, value, unit), ...]
+        Iterator of tuples: (scet, name, value, unit). The metadata and header
+        lines are read immediately; data rows are parsed lazily as the iterator
+        is consumed.
     """
-    fault_rows = []
-
     # Parse time boundaries if provided
     min_datetime = None
     max_datetime = None
 
     if min_time:
-        min_datetime = datetime.strptime(min_time, '%Y-%jT%H:%M:%S')
+        min_datetime = parse_scet(min_time)
     if max_time:
-        max_datetime = datetime.strptime(max_time, '%Y-%jT%H:%M:%S')
+        max_datetime = parse_scet(max_time)
 
     reader = open_csv_file(fault_file)
 
@@ -291,6 +533,21 @@ def parse_fault_data(fault_file, min_time=None, max_time=None):
     # Skip third line (column headers)
     next(reader)
 
+    return iter_fault_rows(reader, min_datetime, max_datetime)
+
+
+def iter_fault_rows(reader, min_datetime=None, max_datetime=None):
+    """
+    Generate fault rows from a csv.reader positioned at the first data row.
+
+    Args:
+        reader: csv.reader over the fault file, past the header lines
+        min_datetime: Optional minimum datetime for filtering
+        max_datetime: Optional maximum datetime for filtering
+
+    Yields:
+        Tuples of (scet, name, value, unit)
+    """
     # Process fault data rows
     for row in reader:
         if not row or len(row) < 4:
@@ -302,47 +559,25 @@ def parse_fault_data(fault_file, min_time=None, max_time=None):
         time_part = row[2].strip()  # Column 3 (0-indexed: column 2)
         value = row[3].strip()       # Column 4 (0-indexed: column 3)
 
+        # Skip rows that cannot hold a timestamp without raising and unwinding
+        # through the exception handler below
+        # (every supported date format starts with a digit)
+        if not date_part or not date_part[0].isdigit():
+            continue
+        if not time_part and 'T' not in date_part:
+            continue
+
         # Parse and normalize to SCET format (YYYY-DDDTHH:MM:SS)
         try:
-            # Try parsing as ordinal date format (YYYY-DDD)
             if 'T' in date_part:
                 # Already combined format
-                scet_datetime = datetime.strptime(f"{date_part}", '%Y-%jT%H:%M:%S')
-            elif '-' in date_part and len(date_part.split('-')) == 2:
-                # Ordinal date format: "2025-354"
-                scet_datetime = datetime.strptime(f"{date_part}T{time_part}", '%Y-%jT%H:%M:%S')
-            elif '/' in date_part:
-                # Calendar date format: "12/20/2025" or "2025/12/20"
-                # Try MM/DD/YYYY format first
-                try:
-                    dt = datetime.strptime(date_part, '%m/%d/%Y')
-                except ValueError:
-                    # Try DD/MM/YYYY format
-                    try:
-                        dt = datetime.strptime(date_part, '%d/%m/%Y')
-                    except ValueError:
-                        # Try YYYY/MM/DD format
-                        dt = datetime.strptime(date_part, '%Y/%m/%d')
-
-                # Parse time and combine
-                time_parts = time_part.split(':')
-                scet_datetime = dt.replace(
-                    hour=int(time_parts[0]),
-                    minute=int(time_parts[1]),
-                    second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
-                )
+                scet_datetime = parse_scet(date_part)
             else:
-                # Try ISO format YYYY-MM-DD
-                dt = datetime.strptime(date_part, '%Y-%m-%d')
-                time_parts = time_part.split(':')
-                scet_datetime = dt.replace(
-                    hour=int(time_parts[0]),
-                    minute=int(time_parts[1]),
-                    second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
-                )
+                # Separate date and time columns
+                scet_datetime = parse_fault_timestamp(date_part, time_part)
 
             # Format as ISO 8601 ordinal date: YYYY-DDDTHH:MM:SS
-            scet_timestamp = scet_datetime.strftime('%Y-%jT%H:%M:%S')
+            scet_timestamp = format_scet(scet_datetime)
 
             # Apply time filtering if specified
             if min_datetime and scet_datetime < min_datetime:
@@ -351,16 +586,76 @@ def parse_fault_data(fault_file, min_time=None, max_time=None):
                 continue
 
             # Add fault row: (scet, name, value, unit)
-            fault_rows.append((scet_timestamp, 'Fault', value, 'none'))
+            yield (scet_timestamp, 'Fault', value, 'none')
 
         except (ValueError, IndexError):
             # Skip rows with invalid timestamps
             continue
 
-    return fault_rows
+
+def expand_data_entries(entries, col_names, col_units):
+    """
+    Lazily expand (scet, values) entries into long-format (scet, name, value, unit) rows.
+
+    The whole pipeline is built from map/zip/repeat, so no Python-level frame runs
+    per input row or per output row.
+
+    Args:
+        entries: Sequence of (scet, values) tuples, values holding one string per data column
+        col_names: Data column names, in the same order as values
+        col_units: Data column units, in the same order as values
+
+    Returns:
+        Iterator of (scet, name, value, unit) tuples
+    """
+    scets = map(operator.itemgetter(0), entries)
+    values = map(operator.itemgetter(1), entries)
+    return chain.from_iterable(map(zip, map(repeat, scets), repeat(col_names),
+                                   values, repeat(col_units)))
+
+
+def write_output_csv(output_file, rows):
+    """
+    Write long-format rows to a CSV file with a scet, name, value, unit header.
+
+    Rows are joined straight into CSV text in chunks, which is much faster than
+    csv.writer for these plain four-field rows. Any chunk containing a field that
+    would need quoting (comma, quote or line break) is written with csv.writer
+    instead, so the output is identical either way.
+
+    Args:
+        output_file: Path to output CSV file
+        rows: Iterable of (scet, name, value, unit) tuples of strings
+
+    Returns:
+        Number of rows written (excluding the header)
+    """
+    total_rows = 0
+    with open(output_file, 'w', newline='', buffering=IO_BUFFER_SIZE) as outfile:
+        writer = csv.writer(outfile)
+
+        # Write output header
+        writer.writerow(['scet', 'name', 'value', 'unit'])
+
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, WRITE_CHUNK_ROWS))
+            if not chunk:
+                break
+
+            text = '\r\n'.join(map(','.join, chunk)) + '\r\n'
+            row_count = len(chunk)
+            if (text.count(',') == 3 * row_count and text.count('\n') == row_count
+                    and text.count('\r') == row_count and '"' not in text):
+                outfile.write(text)
+            else:
+                writer.writerows(chunk)
+            total_rows += row_count
+
+    return total_rows
 
 
-def convert_csv(input_file, output_file, min_time=None, max_time=None, fault_file=None):
+def convert_csv(input_file, output_file, min_time=None, max_time=None, fault_file=None, fault_data=None):
     """
     Convert wide-format CSV to long-format CSV.
 
@@ -379,20 +674,47 @@ def convert_csv(input_file, output_file, min_time=None, max_time=None, fault_fil
         min_time: Optional minimum SCET timestamp (ISO 8601 format). Data before this time is excluded.
         max_time: Optional maximum SCET timestamp (ISO 8601 format). Data after this time is excluded.
         fault_file: Optional path to fault data CSV file. Fault data will be inserted before regular data.
+        fault_data: Optional already-parsed fault rows (as returned by parse_fault_data), used
+            instead of fault_file so the fault file is not parsed again. Not time-filtered here.
+    """
+    rows = convert_csv_rows(input_file, min_time=min_time, max_time=max_time,
+                            fault_file=fault_file, fault_data=fault_data)
+
+    # Write sorted data to output file
+    write_output_csv(output_file, rows)
+
+
+def convert_csv_rows(input_file, min_time=None, max_time=None, fault_file=None, fault_data=None):
+    """
+    Convert a wide-format CSV file to long-format rows without writing them.
+
+    The input is read, filtered and sorted immediately (so errors surface here);
+    the long-format rows are produced lazily as the returned iterator is consumed.
+
+    Args:
+        input_file: Path to input CSV file (see convert_csv for the format)
+        min_time: Optional minimum SCET timestamp (ISO 8601 format). Data before this time is excluded.
+        max_time: Optional maximum SCET timestamp (ISO 8601 format). Data after this time is excluded.
+        fault_file: Optional path to fault data CSV file. Fault data will be inserted before regular data.
+        fault_data: Optional already-parsed fault rows, used instead of fault_file (see convert_csv)
+
+    Returns:
+        Iterator of (scet, name, value, unit) tuples sorted by scet
     """
     # Parse fault data if provided
-    fault_data = []
-    if fault_file:
-        fault_data = parse_fault_data(fault_file, min_time, max_time)
+    if fault_data is None:
+        fault_data = []
+        if fault_file:
+            fault_data = parse_fault_data(fault_file, min_time, max_time)
 
     # Parse time boundaries if provided
     min_datetime = None
     max_datetime = None
 
     if min_time:
-        min_datetime = datetime.strptime(min_time, '%Y-%jT%H:%M:%S')
+        min_datetime = parse_scet(min_time)
     if max_time:
-        max_datetime = datetime.strptime(max_time, '%Y-%jT%H:%M:%S')
+        max_datetime = parse_scet(max_time)
     reader = open_csv_file(input_file)
 
     # Read first line (metadata) to extract base date
@@ -415,11 +737,23 @@ def convert_csv(input_file, output_file, min_time=None, max_time=None, fault_fil
                 second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
             )
             # Convert to ordinal format
-            base_date_str = base_dt.strftime('%Y-%jT%H:%M:%S')
+            base_date_str = format_scet(base_dt)
         except (ValueError, IndexError):
             # If parsing fails, use default
             base_date_str = '2025-354T00:00:00'
 
+    # Express the base date and time boundaries as whole seconds so the row loop
+    # only needs integer arithmetic
+    base_date = parse_base_date(base_date_str)
+    base_sec = base_date.hour * 3600 + base_date.minute * 60 + base_date.second
+    min_sec = None
+    max_sec = None
+
+    if min_datetime:
+        min_sec = int((min_datetime - base_date).total_seconds())
+    if max_datetime:
+        max_sec = int((max_datetime - base_date).total_seconds())
+
     # Read column headers
     headers = next(reader)
 
@@ -427,53 +761,75 @@ def convert_csv(input_file, output_file, min_time=None, max_time=None, fault_fil
     time_col_idx = len(headers) - 1  # Last column
     recnr_col_idx = 0  # First column
 
-    # Get data column names (exclude RecNr and Time)
-    data_columns = []
+    # Get data column names (exclude RecNr and Time), kept as parallel lists
+    col_indices = []
+    col_names = []
+    col_units = []
     for i, header in enumerate(headers):
         if i != recnr_col_idx and i != time_col_idx:
             name, unit = extract_unit_from_column_name(header)
-            data_columns.append((i, name, unit))
-
-    # Collect all output rows for sorting
-    all_rows = []
-
-    # Add fault data (already filtered during parsing)
-    all_rows.extend(fault_data)
+            col_indices.append(i)
+            col_names.append(name)
+            col_units.append(unit)
+
+    # Reshape each row wide -> long in C: fetch all data values with one
+    # itemgetter call and later zip them against the constant column names/units
+    get_values = make_row_getter(col_indices)
+
+    # Collect one (scet, values) entry per kept input row; entries are only
+    # expanded into long-format tuples as they are written. Keeping the values
+    # tuple rather than the csv row list drops the RecNr/Time strings and lets
+    # the garbage collector untrack the entries (tuples of strings).
+    data_entries = []
+
+    # Bind loop invariants to locals to avoid repeated global/attribute lookups
+    n_headers = len(headers)
+    add_entry = data_entries.append
+    parse_offset = parse_time_offset_seconds
+    day_prefix = scet_day_prefix
 
     # Process and collect data rows
     for row in reader:
-        if not row or len(row) < len(headers):
+        if not row or len(row) < n_headers:
             continue
 
-        time_value = row[time_col_idx]
-        # Convert time offset to full SCET timestamp using base date from file header
-        scet_timestamp = parse_time_offset_to_scet(time_value, base_date_str)
-        scet_datetime = datetime.strptime(scet_timestamp, '%Y-%jT%H:%M:%S')
+        offset_sec = parse_offset(row[time_col_idx])
 
         # Apply time filtering
-        if min_datetime and scet_datetime < min_datetime:
+        if min_sec is not None and offset_sec < min_sec:
             continue
-        if max_datetime and scet_datetime > max_datetime:
+        if max_sec is not None and offset_sec > max_sec:
             continue
 
-        # For each data column, collect an output row
-        for col_idx, col_name, col_unit in data_columns:
-            value = row[col_idx]
-            all_rows.append((scet_timestamp, col_name, value, col_unit))
-
-    # Sort all rows by timestamp (first element of tuple)
-    all_rows.sort(key=lambda x: datetime.strptime(x[0], '%Y-%jT%H:%M:%S'))
-
-    # Write sorted data to output file
-    with open(output_file, 'w', newline='') as outfile:
-        writer = csv.writer(outfile)
-
-        # Write output header
-        writer.writerow(['scet', 'name', 'value', 'unit'])
-
-        # Write all sorted rows
-        for row in all_rows:
-            writer.writerow(row)
+        # Convert time offset to full SCET timestamp using base date from file header
+        day_offset, day_sec = divmod(base_sec + offset_sec, 86400)
+        hours, day_sec = divmod(day_sec, 3600)
+        minutes, seconds = divmod(day_sec, 60)
+        scet_timestamp = '%s%02d:%02d:%02d' % (day_prefix(base_date_str, day_offset), hours, minutes, seconds)
+
+        add_entry((scet_timestamp, get_values(row)))
+
+    # Sort by timestamp (first element of tuple). SCET strings are fixed-width
+    # (YYYY-DDDTHH:MM:SS), so string order is chronological order and the key
+    # needs no parsing. Sorting input rows rather than output rows keeps the
+    # sort len(col_names) times smaller, and logs already in time order sort in
+    # a single linear pass.
+    scet_key = operator.itemgetter(0)
+    data_entries.sort(key=scet_key)
+
+    # Merge the (few) fault rows in ahead of data rows with the same timestamp.
+    # Each fault splits the sorted data entries at its bisect position; data
+    # rows are expanded wide -> long only as they are written.
+    output_segments = []
+    start = 0
+    for fault_row in sorted(fault_data, key=scet_key):
+        end = bisect.bisect_left(data_entries, fault_row[0], lo=start, key=scet_key)
+        output_segments.append(expand_data_entries(data_entries[start:end], col_names, col_units))
+        output_segments.append((fault_row,))
+        start = end
+    output_segments.append(expand_data_entries(data_entries[start:], col_names, col_units))
+
+    return chain.from_iterable(output_segments)
 
 
 def convert_log_to_csv(log_file, csv_file):
@@ -484,11 +840,11 @@ def convert_log_to_csv(log_file, csv_file):
         log_file: Path to input .log file
         csv_file: Path to output .csv file
     """
-    with open(log_file, 'r', encoding='utf-8', errors='replace') as infile:
-        content = infile.read()
-
-    with open(csv_file, 'w', encoding='utf-8', newline='') as outfile:
-        outfile.write(content)
+    # Copy in IO_BUFFER_SIZE chunks rather than reading the whole log into memory;
+    # the incremental decoder and newline translation handle chunk boundaries
+    with open(log_file, 'r', encoding='utf-8', errors='replace') as infile, \
+            open(csv_file, 'w', encoding='utf-8', newline='') as outfile:
+        shutil.copyfileobj(infile, outfile, IO_BUFFER_SIZE)
 
 
 def get_time_range_from_csv(csv_file, is_fault_file=False):
@@ -529,7 +885,7 @@ def get_time_range_from_csv(csv_file, is_fault_file=False):
                         second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
                     )
                     # Convert to ordinal format
-                    base_date_str = base_dt.strftime('%Y-%jT%H:%M:%S')
+                    base_date_str = format_scet(base_dt)
                 except (ValueError, IndexError):
                     # If parsing fails, use default
                     base_date_str = '2025-354T00:00:00'
@@ -541,63 +897,50 @@ def get_time_range_from_csv(csv_file, is_fault_file=False):
         if is_fault_file:
             next(reader, None)
 
-        for row in reader:
-            if not row:
-                continue
-
-            try:
-                if is_fault_file:
-                    # Fault file: columns 2 and 3 for date/time
-                    if len(row) < 4:
-                        continue
-                    date_part = row[1].strip()
-                    time_part = row[2].strip()
+        if is_fault_file:
+            for row in reader:
+                # Fault file: columns 2 and 3 for date/time
+                if len(row) < 4:
+                    continue
+                date_part = row[1].strip()
+                time_part = row[2].strip()
 
+                try:
                     # Parse date (handle various formats)
-                    if '-' in date_part and len(date_part.split('-')) == 2:
-                        # Ordinal format
-                        dt = datetime.strptime(f"{date_part}T{time_part}", '%Y-%jT%H:%M:%S')
-                    elif '/' in date_part:
-                        try:
-                            dt = datetime.strptime(date_part, '%m/%d/%Y')
-                        except ValueError:
-                            try:
-                                dt = datetime.strptime(date_part, '%d/%m/%Y')
-                            except ValueError:
-                                dt = datetime.strptime(date_part, '%Y/%m/%d')
-                        time_parts = time_part.split(':')
-                        dt = dt.replace(
-                            hour=int(time_parts[0]),
-                            minute=int(time_parts[1]),
-                            second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
-                        )
-                    else:
-                        dt = datetime.strptime(date_part, '%Y-%m-%d')
-                        time_parts = time_part.split(':')
-                        dt = dt.replace(
-                            hour=int(time_parts[0]),
-                            minute=int(time_parts[1]),
-                            second=int(time_parts[2].split('.')[0]) if len(time_parts) > 2 else 0
-                        )
-                else:
-                    # Data file: last column is time
-                    if len(row) < 2:
-                        continue
-                    time_value = row[-1].strip()
-                    # Use base date from file header
-                    if base_date_str:
-                        dt_str = parse_time_offset_to_scet(time_value, base_date_str)
-                    else:
-                        dt_str = parse_time_offset_to_scet(time_value)
-                    dt = datetime.strptime(dt_str, '%Y-%jT%H:%M:%S')
+                    dt = parse_fault_timestamp(date_part, time_part)
+                except (ValueError, IndexError):
+                    continue
 
                 if min_dt is None or dt < min_dt:
                     min_dt = dt
                 if max_dt is None or dt > max_dt:
                     max_dt = dt
+        else:
+            # Data file: last column is a time offset from the base date. Track
+            # the range as integer seconds and only build datetimes for the result.
+            min_sec = None
+            max_sec = None
+            parse_offset = parse_time_offset_seconds
 
-            except (ValueError, IndexError):
-                continue
+            for row in reader:
+                if len(row) < 2:
+                    continue
+
+                try:
+                    offset_sec = parse_offset(row[-1].strip())
+                except (ValueError, IndexError):
+                    continue
+
+                if min_sec is None or offset_sec < min_sec:
+                    min_sec = offset_sec
+                if max_sec is None or offset_sec > max_sec:
+                    max_sec = offset_sec
+
+            if min_sec is not None:
+                # Use base date from file header
+                base_date = parse_base_date(base_date_str or '2025-354T00:00:00')
+                min_dt = base_date + timedelta(seconds=min_sec)
+                max_dt = base_date + timedelta(seconds=max_sec)
 
     except FileNotFoundError:
         return None, None
@@ -670,25 +1013,71 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
     if verbose:
         print("\nGenerating intermediate output files for debugging...")
 
+    intermediate_files = []
     for data_file_name in ['24HR.csv', '24prev.csv']:
         data_file = dir_path / data_file_name
         if data_file.exists():
             output_name = data_file_name.replace('.csv', '-out.csv')
-            intermediate_output = dir_path / output_name
+            intermediate_files.append((data_file_name, data_file, dir_path / output_name))
+
+    # The conversions are independent and CPU-bound, so run them in separate
+    # processes when there is more than one to do; each worker writes its own
+    # output file, so nothing large is sent back between processes
+    if intermediate_files:
+        executor = None
+        max_workers = min(len(intermediate_files), os.cpu_count() or 1)
+        if max_workers > 1:
+            try:
+                # Imported here so --help and argument errors don't pay for multiprocessing
+                from concurrent.futures.process import BrokenProcessPool, ProcessPoolExecutor
+                executor = ProcessPoolExecutor(max_workers=max_workers)
+            except (ImportError, NotImplementedError, OSError):
+                # No working process pool on this host (e.g. no sem_open or
+                # /dev/shm); convert the files one at a time instead
+                executor = None
 
-            if verbose:
-                print(f"  Converting {data_file_name} -> {output_name}")
+        try:
+            conversions = []
+            for data_file_name, data_file, intermediate_output in intermediate_files:
+                if verbose:
+                    print(f"  Converting {data_file_name} -> {intermediate_output.name}")
 
-            try:
-                convert_csv(
+                conversion_args = dict(
                     input_file=data_file,
                     output_file=intermediate_output,
                     fault_file=None,
                     min_time=None,
                     max_time=None
                 )
-            except Exception as e:
-                print(f"  Warning: Could not convert {data_file_name}: {e}", file=sys.stderr)
+
+                if executor is not None:
+                    try:
+                        conversions.append((data_file_name, conversion_args, executor.submit(convert_csv, **conversion_args)))
+                        continue
+                    except (OSError, BrokenProcessPool):
+                        # Worker processes could not be started; finish sequentially
+                        executor.shutdown()
+                        executor = None
+
+                try:
+                    convert_csv(**conversion_args)
+                except Exception as e:
+                    print(f"  Warning: Could not convert {data_file_name}: {e}", file=sys.stderr)
+
+            for data_file_name, conversion_args, conversion in conversions:
+                try:
+                    try:
+                        conversion.result()
+                    except BrokenProcessPool:
+                        # The worker died without reporting back (e.g. it was
+                        # killed); redo the file in this process
+                        convert_csv(**conversion_args)
+                except Exception as e:
+                    print(f"  Warning: Could not convert {data_file_name}: {e}", file=sys.stderr)
+        finally:
+            # Also reached on errors and KeyboardInterrupt, so workers never outlive the run
+            if executor is not None:
+                executor.shutdown()
 
     # Get time range from FaultLog.csv
     fault_csv = dir_path / 'FaultLog.csv'
@@ -706,7 +1095,7 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
         return False
 
     if verbose:
-        print(f"  FaultLog time range: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+        print(f"  FaultLog time range: {format_scet(fault_min)} to {format_scet(fault_max)}")
 
     # Apply margin if specified
     if margin:
@@ -721,13 +1110,19 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
 
         if verbose:
             print(f"  Applying margin: {margin}")
-            print(f"  Extended time range: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+            print(f"  Extended time range: {format_scet(fault_min)} to {format_scet(fault_max)}")
+
+    # Format the (possibly extended) fault range once for messages and filtering
+    fault_min_scet = format_scet(fault_min)
+    fault_max_scet = format_scet(fault_max)
 
     if verbose:
         print("\nChecking for overlapping data files...")
 
-    # Check which data files overlap with FaultLog (in priority order)
+    # Check which data files overlap with FaultLog (in priority order), keeping
+    # each file's time range so it doesn't have to be scanned again later
     overlapping_files = []
+    file_ranges = {}
 
     for data_file in data_files:
         csv_path = dir_path / data_file.replace('.log', '.csv')
@@ -747,10 +1142,11 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
         has_overlap = check_overlap(fault_min, fault_max, data_min, data_max)
 
         if verbose:
-            print(f"  {csv_path.name}: {data_min.strftime('%Y-%jT%H:%M:%S')} to {data_max.strftime('%Y-%jT%H:%M:%S')} - {'OVERLAP' if has_overlap else 'no overlap'}")
+            print(f"  {csv_path.name}: {format_scet(data_min)} to {format_scet(data_max)} - {'OVERLAP' if has_overlap else 'no overlap'}")
 
         if has_overlap:
             overlapping_files.append(csv_path)
+            file_ranges[csv_path] = (data_min, data_max)
 
     # Validate that at least one file overlaps
     if len(overlapping_files) == 0:
@@ -770,16 +1166,17 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
         if verbose:
             print(f"\nGenerating output: {output_file}")
             if margin:
-                print(f"Filtering data to extended time range: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+                print(f"Filtering data to extended time range: {fault_min_scet} to {fault_max_scet}")
             else:
-                print(f"Filtering data to FaultLog time range: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+                print(f"Filtering data to FaultLog time range: {fault_min_scet} to {fault_max_scet}")
 
-        # Identify fault clusters for analysis
-        fault_data = parse_fault_data(
+        # Identify fault clusters for analysis. The parsed rows are kept and
+        # reused for the conversion below, which applies the same time range.
+        fault_data = list(parse_fault_data(
             fault_csv,
-            min_time=fault_min.strftime('%Y-%jT%H:%M:%S'),
-            max_time=fault_max.strftime('%Y-%jT%H:%M:%S')
-        )
+            min_time=fault_min_scet,
+            max_time=fault_max_scet
+        ))
         fault_clusters = identify_fault_clusters(fault_data)
 
         if verbose and fault_clusters:
@@ -787,17 +1184,16 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
             for i, cluster in enumerate(fault_clusters, 1):
                 duration = cluster['max_time'] - cluster['min_time']
                 duration_str = str(duration).split('.')[0]  # Remove microseconds
-                print(f"    Cluster {i}: {cluster['min_time'].strftime('%Y-%jT%H:%M:%S')} to {cluster['max_time'].strftime('%Y-%jT%H:%M:%S')}")
+                print(f"    Cluster {i}: {format_scet(cluster['min_time'])} to {format_scet(cluster['max_time'])}")
                 print(f"              Duration: {duration_str}, Faults: {cluster['fault_count']}")
 
-        # Generate output using convert_csv with FaultLog and overlapping file
+        # Generate output rows from FaultLog and overlapping file
         # Filter data to only include timestamps within FaultLog time range
-        convert_csv(
+        rows = convert_csv_rows(
             input_file=overlapping_file,
-            output_file=output_file,
-            fault_file=fault_csv,
-            min_time=fault_min.strftime('%Y-%jT%H:%M:%S'),
-            max_time=fault_max.strftime('%Y-%jT%H:%M:%S')
+            fault_data=fault_data,
+            min_time=fault_min_scet,
+            max_time=fault_max_scet
         )
 
         # Apply exclusion policy if specified
@@ -809,25 +1205,17 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
                 except ValueError:
                     pass  # Already handled earlier
 
-            # Read the output file
-            all_rows = []
-            with open(output_file, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = csv.reader(f)
-                next(reader)  # Skip header
-                for row in reader:
-                    all_rows.append(tuple(row))
-
+            # Filter the converted rows in memory before anything is written,
+            # instead of writing the output and reading it back
+            all_rows = list(rows)
             original_count = len(all_rows)
 
             # Filter data
-            all_rows = filter_data_by_clusters(all_rows, fault_clusters, margin_delta)
+            all_rows = filter_data_by_clusters(all_rows, fault_clusters, margin_delta,
+                                               row_range=(fault_min, fault_max))
 
-            # Write filtered data back
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(['scet', 'name', 'value', 'unit'])
-                for row in all_rows:
-                    writer.writerow(row)
+            # Write filtered data
+            write_output_csv(output_file, all_rows)
 
             if verbose:
                 excluded_count = original_count - len(all_rows)
@@ -835,6 +1223,8 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
                 print(f"    Original rows: {original_count:,}")
                 print(f"    Excluded rows: {excluded_count:,} ({100*excluded_count/original_count:.1f}%)")
                 print(f"    Remaining rows: {len(all_rows):,}")
+        else:
+            write_output_csv(output_file, rows)
 
     else:  # overlap_policy == 'ALL'
         # Merge data from all overlapping files, excluding duplicate time ranges
@@ -844,24 +1234,27 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
         if verbose:
             print(f"\nGenerating output: {output_file}")
             if margin:
-                print(f"Filtering data to extended time range: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+                print(f"Filtering data to extended time range: {fault_min_scet} to {fault_max_scet}")
             else:
-                print(f"Filtering data to FaultLog time range: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+                print(f"Filtering data to FaultLog time range: {fault_min_scet} to {fault_max_scet}")
 
-        # Collect data from all files, tracking covered time ranges
-        all_rows = []
+        # Collect a time-sorted row stream from each file, tracking covered time ranges
+        row_sources = []
         covered_ranges = []  # List of (min, max) tuples
 
         # First, process fault data separately using the full fault range
         if verbose:
-            print(f"  Processing FaultLog.csv: {fault_min.strftime('%Y-%jT%H:%M:%S')} to {fault_max.strftime('%Y-%jT%H:%M:%S')}")
+            print(f"  Processing FaultLog.csv: {fault_min_scet} to {fault_max_scet}")
 
-        fault_data = parse_fault_data(
+        # Sort straight from the parser (stable, so equal timestamps keep file
+        # order); the one list serves both cluster detection and the merge
+        scet_key = operator.itemgetter(0)
+        fault_data = sorted(parse_fault_data(
             fault_csv,
-            min_time=fault_min.strftime('%Y-%jT%H:%M:%S'),
-            max_time=fault_max.strftime('%Y-%jT%H:%M:%S')
-        )
-        all_rows.extend(fault_data)
+            min_time=fault_min_scet,
+            max_time=fault_max_scet
+        ), key=scet_key)
+        row_sources.append(fault_data)
 
         # Identify fault clusters
         fault_clusters = identify_fault_clusters(fault_data)
@@ -871,13 +1264,13 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
             for i, cluster in enumerate(fault_clusters, 1):
                 duration = cluster['max_time'] - cluster['min_time']
                 duration_str = str(duration).split('.')[0]  # Remove microseconds
-                print(f"    Cluster {i}: {cluster['min_time'].strftime('%Y-%jT%H:%M:%S')} to {cluster['max_time'].strftime('%Y-%jT%H:%M:%S')}")
+                print(f"    Cluster {i}: {format_scet(cluster['min_time'])} to {format_scet(cluster['max_time'])}")
                 print(f"              Duration: {duration_str}, Faults: {cluster['fault_count']}")
 
         # Then process each data file
         for file_path in overlapping_files:
-            # Get the time range of this file
-            file_min, file_max = get_time_range_from_csv(file_path, is_fault_file=False)
+            # Get the time range of this file (scanned during the overlap check)
+            file_min, file_max = file_ranges[file_path]
 
             # Calculate the intersection of this file's range with the fault range
             segment_min = max(fault_min, file_min)
@@ -897,40 +1290,33 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
                     print(f"  Skipping {file_path.name} - time range fully covered by previous files")
                 continue
 
+            segment_min_scet = format_scet(segment_min)
+            segment_max_scet = format_scet(segment_max)
+
             # Calculate the uncovered portion
             # For now, we'll use a simple approach: include data from ranges not fully covered
             # We'll use the segment but exclude exact timestamp duplicates later
             if verbose:
-                print(f"  Processing {file_path.name}: {segment_min.strftime('%Y-%jT%H:%M:%S')} to {segment_max.strftime('%Y-%jT%H:%M:%S')}")
-
-            # Create a temporary output file
-            temp_file = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.csv')
-            temp_path = temp_file.name
-            temp_file.close()
-
-            try:
-                # Process this file without fault data (fault data processed separately)
-                convert_csv(
-                    input_file=file_path,
-                    output_file=temp_path,
-                    fault_file=None,
-                    min_time=segment_min.strftime('%Y-%jT%H:%M:%S'),
-                    max_time=segment_max.strftime('%Y-%jT%H:%M:%S')
-                )
-
-                # Read the temporary file and collect rows
-                with open(temp_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    reader = csv.reader(f)
-                    next(reader)  # Skip header
-                    for row in reader:
-                        all_rows.append(tuple(row))
-
-                # Track this range as covered
-                covered_ranges.append((segment_min, segment_max))
-
-            finally:
-                # Clean up temporary file
-                Path(temp_path).unlink()
+                print(f"  Processing {file_path.name}: {segment_min_scet} to {segment_max_scet}")
+
+            # Process this file without fault data (fault data processed separately);
+            # convert_csv_rows yields its rows already sorted by timestamp
+            row_sources.append(convert_csv_rows(
+                input_file=file_path,
+                fault_file=None,
+                min_time=segment_min_scet,
+                max_time=segment_max_scet
+            ))
+
+            # Track this range as covered
+            covered_ranges.append((segment_min, segment_max))
+
+        # Merge the sorted streams by timestamp (no deduplication - keep all
+        # measurements). Fixed-width SCET strings sort chronologically as plain
+        # strings, and the merge is stable, so at equal timestamps fault rows come
+        # first and data files keep their priority order, as a stable sort of all
+        # rows would give, without holding every output row in memory.
+        rows = heapq.merge(*row_sources, key=scet_key)
 
         # Apply exclusion policy if specified
         if exclude_policy == 'ALL' and fault_clusters:
@@ -941,28 +1327,23 @@ def process_directory_mode(directory, output_file, margin=None, overlap_policy='
                 except ValueError:
                     pass  # Already handled earlier
 
+            all_rows = list(rows)
             original_count = len(all_rows)
-            all_rows = filter_data_by_clusters(all_rows, fault_clusters, margin_delta)
+            rows = filter_data_by_clusters(all_rows, fault_clusters, margin_delta,
+                                           row_range=(fault_min, fault_max))
 
             if verbose:
-                excluded_count = original_count - len(all_rows)
+                excluded_count = original_count - len(rows)
                 print(f"\n  Data exclusion applied:")
                 print(f"    Original rows: {original_count:,}")
                 print(f"    Excluded rows: {excluded_count:,} ({100*excluded_count/original_count:.1f}%)")
-                print(f"    Remaining rows: {len(all_rows):,}")
-
-        # Sort all rows by timestamp (no deduplication - keep all measurements)
-        all_rows.sort(key=lambda x: datetime.strptime(x[0], '%Y-%jT%H:%M:%S'))
+                print(f"    Remaining rows: {len(rows):,}")
 
         # Write to output file
-        with open(output_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['scet', 'name', 'value', 'unit'])
-            for row in all_rows:
-                writer.writerow(row)
+        row_count = write_output_csv(output_file, rows)
 
         if verbose:
-            print(f"  Merged {len(all_rows)} rows from {len(overlapping_files)} files")
+            print(f"  Merged {row_count} rows from {len(overlapping_files)} files")
 
     return True
 
@@ -1155,6 +1536,12 @@ def start_web_server(input_files, output_file, fault_file=None, plot_html=None,
         plot_html: Optional HTML string containing the plot
         port: Port to run the server on (default 5000)
     """
+    # Imported here so conversion-only runs (--no-browser, --help) don't pay for them
+    from flask import Flask
+    import threading
+    import time
+    import webbrowser
+
     app = Flask(__name__)
 
     html_content = generate_summary_html(input_files, output_file, fault_file, plot_html)